@@ -0,0 +1,47 @@
+# _kernels.py
+"""
+JIT-compiled analytics kernels.
+
+Numba is optional: when it is installed the kernels are compiled with
+cache=True (so the 50-200 ms cold compile is paid once per machine, not
+per run); otherwise they run as plain Python/NumPy with a one-time
+warning. Kernels stay module-level — never defined inside a method — so
+Numba's dispatcher is created once.
+"""
+import warnings
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    warnings.warn("numba is not installed; analytics kernels will run un-JITed")
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+# explicit signature: compile at import (backed by cache=True) instead of
+# stalling the collector thread on the first tick
+@njit(["Tuple((float64, int64))(float32[:], float64)"], cache=True)
+def window_stats(values, crit):
+    """
+    Mean of the window and the number of samples above crit, computed in
+    one fused pass with no temporary arrays.
+    """
+    n = values.shape[0]
+    total = 0.0
+    spikes = 0
+    for i in range(n):
+        v = values[i]
+        total += v
+        if v > crit:
+            spikes += 1
+    mean = total / n if n > 0 else 0.0
+    return mean, spikes
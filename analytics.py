@@ -1,25 +1,121 @@
 # analytics.py
-from collections import deque
+import sys
 import time
 
+import numpy as np
+
+from _kernels import window_stats
+
+# local-time offset cached at import; alert stamps tolerate a stale
+# offset across a DST change rather than paying strftime per call
+_UTC_OFFSET = time.localtime().tm_gmtoff or 0
+
+
+# interned alert levels: the GUI's dedupe path compares levels on every
+# alert, and interning makes those comparisons pointer checks
+_WARNING = sys.intern("WARNING")
+_CRITICAL = sys.intern("CRITICAL")
+
+
+def _hms(t=None):
+    """Format epoch seconds as HH:MM:SS with integer arithmetic only."""
+    if t is None:
+        t = time.time()
+    t = int(t) + _UTC_OFFSET
+    return f"{(t // 3600) % 24:02d}:{(t // 60) % 60:02d}:{t % 60:02d}"
+
 
 class AnalyticsEngine:
     """
     Maintains CPU/RAM history and generates alerts based on simple rules.
+
+    History lives in fixed-size NumPy ring buffers (float32 percentages
+    plus the epoch timestamp of each sample) instead of deques of
+    pre-formatted strings. Writes are O(1) with no allocation; readers
+    get oldest-first array views and format time labels lazily.
     """
     def __init__(self, max_history=60):
-        self.cpu_history = deque(maxlen=max_history)
-        self.memory_history = deque(maxlen=max_history)
-        self.time_history = deque(maxlen=max_history)
+        self.max_history = max_history
+        self._cpu = np.zeros(max_history, dtype=np.float32)
+        self._mem = np.zeros(max_history, dtype=np.float32)
+        self._t = np.zeros(max_history, dtype=np.float64)
+        self._head = 0
+        self._n = 0
+
+    def __len__(self):
+        return self._n
 
     def update_history(self, system_stats: dict):
         """
         Add a new point to history.
         """
-        now = time.strftime("%H:%M:%S")
-        self.time_history.append(now)
-        self.cpu_history.append(system_stats["cpu_percent"])
-        self.memory_history.append(system_stats["memory_percent"])
+        i = self._head
+        self._cpu[i] = system_stats["cpu_percent"]
+        self._mem[i] = system_stats["memory_percent"]
+        self._t[i] = time.time()
+        self._head = (i + 1) % self.max_history
+        if self._n < self.max_history:
+            self._n += 1
+
+    def _view(self, buf):
+        if self._n < self.max_history:
+            # buffer still filling: the prefix is already oldest-first
+            return buf[:self._n]
+        return np.roll(buf, -self._head)
+
+    def cpu_view(self):
+        """CPU history, oldest first (view while filling, copy once wrapped)."""
+        return self._view(self._cpu)
+
+    def memory_view(self):
+        """Memory history, oldest first."""
+        return self._view(self._mem)
+
+    def time_view(self):
+        """Epoch timestamps of the samples, oldest first."""
+        return self._view(self._t)
+
+    def check_alerts_window(self, window=10):
+        """
+        Vectorized alert scan over the recent history window.
+        Rolling means and spike counts come from a single fused kernel
+        pass over the ring buffers (JIT-compiled when numba is
+        available), so the cost stays flat if the polling rate goes up.
+        Returns the same alert-dict shape as check_alerts.
+        """
+        if self._n == 0:
+            return []
+        w = min(window, self._n)
+        cpu = self.cpu_view()[-w:]
+        mem = self.memory_view()[-w:]
+
+        alerts = []
+
+        cpu_avg, cpu_spikes = window_stats(cpu, 90.0)
+        if cpu_avg > 85:
+            alerts.append({
+                "level": _WARNING,
+                "message": f"Sustained CPU load: {cpu_avg:.1f}% avg over {w} samples"
+            })
+        elif cpu_spikes >= max(2, w // 2):
+            alerts.append({
+                "level": _WARNING,
+                "message": f"CPU spiked above 90% in {cpu_spikes} of last {w} samples"
+            })
+
+        mem_avg, _ = window_stats(mem, 90.0)
+        if mem_avg > 85:
+            alerts.append({
+                "level": _WARNING,
+                "message": f"Sustained memory pressure: {mem_avg:.1f}% avg over {w} samples"
+            })
+
+        # stamp lazily: no formatting at all on alert-free ticks
+        if alerts:
+            now = _hms()
+            for alert in alerts:
+                alert["time"] = now
+        return alerts
 
     def check_alerts(self, system_stats: dict):
         """
@@ -29,34 +125,34 @@ class AnalyticsEngine:
         alerts = []
         cpu = system_stats["cpu_percent"]
         mem = system_stats["memory_percent"]
-        now = time.strftime("%H:%M:%S")
 
         # CPU alerts
         if cpu > 90:
             alerts.append({
-                "level": "CRITICAL",
-                "message": f"CPU usage is {cpu:.1f}%",
-                "time": now
+                "level": _CRITICAL,
+                "message": f"CPU usage is {cpu:.1f}%"
             })
         elif cpu > 80:
             alerts.append({
-                "level": "WARNING",
-                "message": f"CPU usage is high: {cpu:.1f}%",
-                "time": now
+                "level": _WARNING,
+                "message": f"CPU usage is high: {cpu:.1f}%"
             })
 
         # Memory alerts
         if mem > 90:
             alerts.append({
-                "level": "CRITICAL",
-                "message": f"Memory usage is {mem:.1f}%",
-                "time": now
+                "level": _CRITICAL,
+                "message": f"Memory usage is {mem:.1f}%"
             })
         elif mem > 80:
             alerts.append({
-                "level": "WARNING",
-                "message": f"Memory usage is high: {mem:.1f}%",
-                "time": now
+                "level": _WARNING,
+                "message": f"Memory usage is high: {mem:.1f}%"
             })
 
+        # stamp lazily: no formatting at all on alert-free ticks
+        if alerts:
+            now = _hms()
+            for alert in alerts:
+                alert["time"] = now
         return alerts
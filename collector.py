@@ -1,12 +1,127 @@
 # collector.py
+import os
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
 import psutil
 
+
+@dataclass
+class ProcessSnapshot:
+    """
+    Columnar (SoA) process snapshot: one array per numeric field plus
+    parallel string lists; row i across all fields is one process.
+    _make_snapshot orders the columns by CPU via argsort, and the table
+    model indexes them directly; interactive sorting and filtering
+    happen in the GUI's sort proxy.
+    """
+    pid: np.ndarray       # int32
+    cpu: np.ndarray       # float32, percent
+    mem: np.ndarray       # float32, MB
+    names: list
+    statuses: list
+
+    def __len__(self):
+        return len(self.pid)
+
+
+def _make_snapshot(pids, names, statuses, cpus, mems, limit=50):
+    """Build a ProcessSnapshot sorted by CPU descending, truncated to limit."""
+    pid = np.asarray(pids, dtype=np.int32)
+    cpu = np.asarray(cpus, dtype=np.float32)
+    mem = np.asarray(mems, dtype=np.float32)
+    # stable sort keeps equal-CPU rows in enumeration (pid) order, so
+    # ties don't reshuffle between sweeps and diffs stay small
+    order = np.argsort(-cpu, kind="stable")[:limit]
+    return ProcessSnapshot(
+        pid=pid[order],
+        cpu=cpu[order],
+        mem=mem[order],
+        names=[names[i] for i in order],
+        statuses=[statuses[i] for i in order]
+    )
+
+_IS_LINUX = sys.platform.startswith("linux")
+
+# (busy, total) jiffies from the previous /proc/stat read
+_last_cpu_times = None
+
+
+def _fast_linux_stats():
+    """
+    Read CPU and memory usage straight from /proc.
+
+    One line of /proc/stat and two keys from /proc/meminfo replace
+    psutil's full object graph; cpu_percent comes from differencing
+    jiffy counters against the previous call.
+    """
+    global _last_cpu_times
+
+    with open("/proc/stat") as f:
+        fields = f.readline().split()[1:8]
+    user, nice, system, idle, iowait, irq, softirq = map(int, fields)
+    busy = user + nice + system + irq + softirq
+    total = busy + idle + iowait
+
+    if _last_cpu_times is None:
+        cpu_percent = 0.0
+    else:
+        last_busy, last_total = _last_cpu_times
+        dt = total - last_total
+        cpu_percent = 100.0 * (busy - last_busy) / dt if dt > 0 else 0.0
+    _last_cpu_times = (busy, total)
+
+    meminfo = {}
+    with open("/proc/meminfo") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("MemTotal", "MemAvailable"):
+                meminfo[key] = int(rest.split()[0]) * 1024
+                if len(meminfo) == 2:
+                    break
+
+    mem_total = meminfo["MemTotal"]
+    mem_used = mem_total - meminfo["MemAvailable"]
+    mem_percent = 100.0 * mem_used / mem_total if mem_total else 0.0
+
+    return {
+        "cpu_percent": round(cpu_percent, 1),
+        "memory_used": mem_used,
+        "memory_total": mem_total,
+        "memory_percent": round(mem_percent, 1)
+    }
+
+# Short-TTL cache for virtual_memory(): with stats polled at 4 Hz,
+# redundant reads inside the same tick window return the cached tuple.
+_VM_TTL = 0.2
+_vm_cache = (0.0, None)
+
+
+def _virtual_memory_cached():
+    global _vm_cache
+    now = time.monotonic()
+    ts, vm = _vm_cache
+    if vm is None or now - ts >= _VM_TTL:
+        vm = psutil.virtual_memory()
+        _vm_cache = (now, vm)
+    return vm
+
+
 def get_system_stats():
     """
     Returns a dict with overall CPU and memory stats.
+    Uses the direct /proc path on Linux, psutil elsewhere.
     """
+    if _IS_LINUX:
+        try:
+            return _fast_linux_stats()
+        except (OSError, ValueError, KeyError):
+            pass  # fall back to psutil
+
     cpu_percent = psutil.cpu_percent(interval=None)
-    mem = psutil.virtual_memory()
+    mem = _virtual_memory_cached()
 
     return {
         "cpu_percent": cpu_percent,
@@ -16,34 +131,131 @@ def get_system_stats():
     }
 
 
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if _IS_LINUX else 100
+# pages -> MB factor, folded once at import so the sweep does a single multiply
+_PAGE_MB = (os.sysconf("SC_PAGE_SIZE") if _IS_LINUX else 4096) / (1024 * 1024)
+
+# pid -> (utime+stime jiffies, monotonic timestamp) from the previous sweep,
+# used to turn cumulative CPU time into a percentage
+_last_proc_cpu = {}
+
+# single-letter /proc/[pid]/stat states -> psutil-style status strings
+_STATE_NAMES = {
+    "R": "running", "S": "sleeping", "D": "disk-sleep", "Z": "zombie",
+    "T": "stopped", "t": "tracing-stop", "I": "idle", "X": "dead"
+}
+
+
+def _fast_linux_process_list():
+    """
+    Enumerate processes by reading /proc/[pid]/stat directly.
+
+    One small read per pid gives name, state, CPU jiffies and RSS in a
+    single pass, skipping psutil's per-process Process objects entirely.
+    cpu_percent is derived from jiffy deltas between sweeps.
+    """
+    pids, names, statuses, cpus, mems = [], [], [], [], []
+    now = time.monotonic()
+    seen = set()
+
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        pid = int(entry.name)
+        try:
+            with open(entry.path + "/stat", "rb") as f:
+                data = f.read()
+        except OSError:
+            continue  # process exited or access denied
+
+        # comm is parenthesized and may itself contain spaces/parens
+        lpar = data.find(b"(")
+        rpar = data.rfind(b")")
+        if lpar < 0 or rpar < 0:
+            continue
+        name = data[lpar + 1:rpar].decode("utf-8", "replace")
+        fields = data[rpar + 2:].split()
+
+        state = fields[0].decode()
+        total_jiffies = int(fields[11]) + int(fields[12])  # utime + stime
+        rss_pages = int(fields[21])
+
+        last = _last_proc_cpu.get(pid)
+        if last is None:
+            cpu_percent = 0.0
+        else:
+            last_total, last_ts = last
+            dt = now - last_ts
+            cpu_percent = ((total_jiffies - last_total) / _CLK_TCK / dt * 100.0) if dt > 0 else 0.0
+        _last_proc_cpu[pid] = (total_jiffies, now)
+        seen.add(pid)
+
+        pids.append(pid)
+        names.append(name)
+        statuses.append(_STATE_NAMES.get(state, state))
+        cpus.append(cpu_percent)
+        mems.append(rss_pages * _PAGE_MB)
+
+    for pid in _last_proc_cpu.keys() - seen:
+        del _last_proc_cpu[pid]
+
+    return _make_snapshot(pids, names, statuses, cpus, mems)
+
+
+# Cache of live psutil.Process handles keyed by pid. Reusing handles keeps
+# psutil's per-process state (cpu_percent deltas, open proc fds) alive between
+# sweeps and lets us skip the expensive PID-reuse check on every call.
+_proc_cache = {}
+
+# frozen module-level tuple: no per-call list allocation
+_PROC_ATTRS = ('pid', 'name', 'status', 'cpu_percent', 'memory_info')
+
+
 def get_process_list():
     """
-    Returns a list of dicts with process info.
-    Each dict: pid, name, status, cpu_percent, memory_mb
+    Returns a ProcessSnapshot of the current processes, sorted by CPU
+    descending. Uses the direct /proc sweep on Linux, psutil elsewhere.
     """
-    processes = []
-    # First call to initialize cpu_percent so next is meaningful
-    psutil.cpu_percent(interval=None)
+    if _IS_LINUX:
+        try:
+            return _fast_linux_process_list()
+        except OSError:
+            pass  # fall back to psutil
 
-    for proc in psutil.process_iter(['pid', 'name', 'status', 'cpu_percent', 'memory_info']):
+    pids, names, statuses, cpus, mems = [], [], [], [], []
+
+    current_pids = set(psutil.pids())
+    dead = _proc_cache.keys() - current_pids
+    for pid in dead:
+        del _proc_cache[pid]
+    if dead and hasattr(psutil.process_iter, "cache_clear"):
+        # only drop psutil's internal iterator cache when pids went away
+        psutil.process_iter.cache_clear()
+    for pid in current_pids - _proc_cache.keys():
         try:
-            info = proc.info
-            mem_info = info.get('memory_info', None)
-            memory_mb = (mem_info.rss / (1024 * 1024)) if mem_info else 0.0
-
-            processes.append({
-                "pid": info.get('pid', 0),
-                "name": info.get('name', 'N/A'),
-                "status": info.get('status', 'N/A'),
-                "cpu_percent": info.get('cpu_percent', 0.0),
-                "memory_mb": memory_mb
-            })
+            _proc_cache[pid] = psutil.Process(pid)
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             continue
 
-    # Sort by CPU usage descending
-    processes.sort(key=lambda p: p["cpu_percent"], reverse=True)
-    return processes[:50]
+    for pid, proc in list(_proc_cache.items()):
+        try:
+            info = proc.as_dict(attrs=_PROC_ATTRS, ad_value=None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            del _proc_cache[pid]
+            continue
+
+        # as_dict(attrs=...) guarantees every key exists, so index directly;
+        # ad_value=None only shows up where access was denied
+        mem_info = info['memory_info']
+        memory_mb = (mem_info.rss / (1024 * 1024)) if mem_info else 0.0
+
+        pids.append(info['pid'] or pid)
+        names.append(info['name'] or 'N/A')
+        statuses.append(info['status'] or 'N/A')
+        cpus.append(info['cpu_percent'] or 0.0)
+        mems.append(memory_mb)
+
+    return _make_snapshot(pids, names, statuses, cpus, mems)
 
 
 def kill_process(pid: int) -> bool:
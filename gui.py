@@ -1,31 +1,366 @@
 # gui.py
+import logging
+import time
+
+import numpy as np
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QTableWidget, QTableWidgetItem, QPushButton,
+    QLabel, QTableView, QPushButton,
     QHeaderView, QMessageBox, QListWidget, QListWidgetItem,
-    QLineEdit, QComboBox, QFrame, QSplitter, QStatusBar, QSizePolicy
+    QLineEdit, QComboBox, QFrame, QSplitter, QStatusBar, QSizePolicy,
+    QStyledItemDelegate, QStyleOptionButton, QStyle
+)
+from PyQt5.QtCore import (
+    QAbstractTableModel, QEvent, QModelIndex, QPointF, QRect,
+    QSortFilterProxyModel, QTimer, QThread, Qt, pyqtSignal
 )
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtGui import QBrush, QColor, QFont, QPainter, QPen, QPolygonF
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter
+
+from worker import CollectorWorker
+
+# Qt enum values resolved once at import: model.data() runs for every
+# visible cell on every repaint, so per-call Qt namespace lookups add up
+_DISPLAY_ROLE = int(Qt.DisplayRole)
+_USER_ROLE = int(Qt.UserRole)
+_ALIGNMENT_ROLE = int(Qt.TextAlignmentRole)
+_ALIGN_CENTER = int(Qt.AlignCenter)
+
+# bytes -> GB as a single multiply on the stats hot path
+_GB = 1.0 / (1024.0 ** 3)
+
+# pre-bound .format callables: the format string is parsed once at import
+# instead of on every stats tick
+_CPU_FMT = "CPU: {:.1f} %".format
+_MEM_FMT = "Memory: {:.1f} % ({:.2f} / {:.2f} GB)".format
+_PCT_FMT = "{:.1f} %".format
+
+# shared paint resources, built once at import: setForeground(Qt.red)
+# constructs a throwaway QBrush per alert item, and every repeated
+# QFont(...) call re-resolves the same font request
+_BRUSH_RED = QBrush(QColor("#ef4444"))
+_BRUSH_YELLOW = QBrush(QColor("#facc15"))
+_FONT_REGULAR_10 = QFont("Segoe UI", 10)
+_FONT_BOLD_10 = QFont("Segoe UI", 10, QFont.Bold)
+_FONT_BOLD_11 = QFont("Segoe UI", 11, QFont.Bold)
+_FONT_BOLD_18 = QFont("Segoe UI", 18, QFont.Bold)
+_FONT_SMALL_8 = QFont("Segoe UI", 8)
+
+
+class _RateLimitFilter(logging.Filter):
+    """Drop repeats of the same record within `interval` seconds."""
+    def __init__(self, interval=1.0):
+        super().__init__()
+        self.interval = interval
+        self._last_seen = {}
+
+    def filter(self, record):
+        now = time.monotonic()
+        key = (record.levelno, record.msg)
+        last = self._last_seen.get(key)
+        if last is not None and now - last < self.interval:
+            return False
+        self._last_seen[key] = now
+        return True
+
+
+_log = logging.getLogger(__name__)
+_log.addFilter(_RateLimitFilter(1.0))
 
 
 class MplCanvas(FigureCanvas):
-    """Matplotlib canvas embedded in PyQt."""
+    """
+    Matplotlib canvas embedded in PyQt.
+
+    Titles, limits and grids are configured once here; per-tick updates
+    go through the persistent Line2D handles plus blitting instead of
+    tearing down and rebuilding the Artist tree every second.
+    """
     def __init__(self, parent=None):
         fig = Figure()
         # store fig on self so other code can access it
         self.fig = fig
         self.axes_cpu = self.fig.add_subplot(211)
         self.axes_mem = self.fig.add_subplot(212)
+
+        # static decorations, built exactly once
+        self.axes_cpu.set_ylabel("CPU %")
+        self.axes_cpu.set_ylim(0, 100)
+        self.axes_cpu.set_title("CPU Usage (Recent)")
+        self.axes_cpu.grid(True, alpha=0.25)
+
+        self.axes_mem.set_ylabel("Memory %")
+        self.axes_mem.set_ylim(0, 100)
+        self.axes_mem.set_xlabel("Time")
+        self.axes_mem.set_title("Memory Usage (Recent)")
+        self.axes_mem.grid(True, alpha=0.25)
+
+        # animated lines are excluded from normal draws and blitted on top;
+        # antialiasing is off on these hot artists (pyqtgraph-style tradeoff)
+        self.cpu_line, = self.axes_cpu.plot([], [], marker='o', linewidth=2,
+                                            color='#3b82f6', animated=True,
+                                            antialiased=False)
+        self.mem_line, = self.axes_mem.plot([], [], marker='o', linewidth=2,
+                                            color='#ef4444', animated=True,
+                                            antialiased=False)
+
+        # subplots_adjust instead of tight_layout (avoids singular matrix error)
+        self.fig.subplots_adjust(left=0.1, right=0.95, top=0.95, bottom=0.15, hspace=0.7)
+
+        # time labels are formatted lazily: only the handful of visible
+        # ticks go through strftime, not every sample every tick
+        self.sample_times = None
+        formatter = FuncFormatter(self._format_time_tick)
+        for axes in (self.axes_cpu, self.axes_mem):
+            axes.xaxis.set_major_formatter(formatter)
+            axes.tick_params(axis='x', labelrotation=45, labelsize=8)
+
+        self.blit_background = None
+
         super().__init__(self.fig)
         self.setParent(parent)
 
+    def _format_time_tick(self, value, pos):
+        if self.sample_times is None:
+            return ""
+        i = int(round(value))
+        if 0 <= i < len(self.sample_times):
+            return time.strftime("%H:%M:%S", time.localtime(self.sample_times[i]))
+        return ""
+
+    def resizeEvent(self, event):
+        # cached background is wrong after a resize; force a full redraw
+        self.blit_background = None
+        super().resizeEvent(event)
+
+    def redraw_and_cache(self):
+        """Full draw of the static scene, then cache it for blitting."""
+        self.draw()
+        # one cached background per axes, matching the per-axes blits:
+        # restores never touch the figure margins between the plots
+        self.blit_background = (self.copy_from_bbox(self.axes_cpu.bbox),
+                                self.copy_from_bbox(self.axes_mem.bbox))
+        self._draw_lines_and_blit()
+
+    def blit_lines(self):
+        """Cheap path: restore cached backgrounds and repaint only the lines."""
+        bg_cpu, bg_mem = self.blit_background
+        self.restore_region(bg_cpu)
+        self.restore_region(bg_mem)
+        self._draw_lines_and_blit()
+
+    def _draw_lines_and_blit(self):
+        self.axes_cpu.draw_artist(self.cpu_line)
+        self.axes_mem.draw_artist(self.mem_line)
+        # blit only the two axes regions, not the full canvas
+        self.blit(self.axes_cpu.bbox)
+        self.blit(self.axes_mem.bbox)
+
+
+class Sparkline(QWidget):
+    """
+    Tiny QPainter trend line for the stat cards.
+
+    One drawPolyline per repaint — no figure, axes or tick machinery —
+    so the card-sized history preview costs microseconds per tick. The
+    matplotlib canvas in the graphs card remains the full-detail view.
+    """
+    def __init__(self, color, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(26)
+        self._pen = QPen(QColor(color), 1.5)
+        self._values = None
+
+    def set_values(self, values):
+        """Store the latest history view (0-100 %) and schedule a repaint."""
+        self._values = values
+        self.update()
+
+    def paintEvent(self, event):
+        values = self._values
+        if values is None or len(values) < 2:
+            return
+        w = self.width() - 1
+        h = self.height() - 3
+        dx = w / (len(values) - 1)
+        poly = QPolygonF([QPointF(i * dx, 1 + h - (v * h) / 100.0)
+                          for i, v in enumerate(values)])
+        painter = QPainter(self)
+        painter.setPen(self._pen)
+        painter.drawPolyline(poly)
+
+
+class ProcessTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a collector.ProcessSnapshot.
+
+    Qt only asks data() for visible cells, so painting cost is
+    O(visible rows) no matter how many processes are in the snapshot —
+    unlike QTableWidget, which held a widget item per cell.
+    """
+    HEADERS = ["PID", "Name", "Status", "CPU %", "Memory (MB)", "Action"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._snap = None
+        self._pid_text = []
+        self._cpu_text = []
+        self._mem_text = []
+
+    def set_snapshot(self, snap):
+        # a full model reset drops selection and scroll position, so when
+        # the row count is stable we refresh in place via dataChanged
+        in_place = self._snap is not None and len(self._snap) == len(snap)
+        if not in_place:
+            self.beginResetModel()
+        old_snap = self._snap
+        old_pid, old_cpu, old_mem = self._pid_text, self._cpu_text, self._mem_text
+        self._snap = snap
+        if in_place:
+            # one vectorized compare flags the rows whose raw numbers
+            # moved; everything else reuses last sweep's rendered strings
+            # instead of re-running str()/f-strings per cell
+            numeric_changed = ((snap.pid != old_snap.pid)
+                               | (snap.cpu != old_snap.cpu)
+                               | (snap.mem != old_snap.mem))
+            pid_text = list(old_pid)
+            cpu_text = list(old_cpu)
+            mem_text = list(old_mem)
+            # locals for everything the per-row loop touches: attribute
+            # and bound-method lookups inside a tight loop cost real time
+            pid_arr, cpu_arr, mem_arr = snap.pid, snap.cpu, snap.mem
+            names, statuses = snap.names, snap.statuses
+            old_names, old_statuses = old_snap.names, old_snap.statuses
+            # emit one dataChanged per contiguous run of rows whose
+            # rendered content differs, so untouched rows between two
+            # changes are never repainted; identical sweeps emit nothing
+            last_col = len(self.HEADERS) - 1
+            roles = [Qt.DisplayRole, Qt.UserRole]
+            first = last = -1
+            for row in range(len(snap)):
+                meta_same = (names[row] == old_names[row]
+                             and statuses[row] == old_statuses[row])
+                if numeric_changed[row]:
+                    p = str(pid_arr[row])
+                    c = f"{cpu_arr[row]:.1f}"
+                    m = f"{mem_arr[row]:.1f}"
+                    rendered_same = (p == old_pid[row] and c == old_cpu[row]
+                                     and m == old_mem[row])
+                    pid_text[row], cpu_text[row], mem_text[row] = p, c, m
+                    if rendered_same and meta_same:
+                        continue  # value moved but rounds to the same text
+                elif meta_same:
+                    continue
+                if first < 0:
+                    first = row
+                elif row > last + 1:
+                    self.dataChanged.emit(self.index(first, 0),
+                                          self.index(last, last_col), roles)
+                    first = row
+                last = row
+            if first >= 0:
+                self.dataChanged.emit(self.index(first, 0),
+                                      self.index(last, last_col), roles)
+            self._pid_text, self._cpu_text, self._mem_text = pid_text, cpu_text, mem_text
+        else:
+            # format once per snapshot: Qt re-queries data() on every
+            # hover and scroll repaint, so cells must not re-run
+            # f-strings each time
+            self._pid_text = [str(p) for p in snap.pid]
+            self._cpu_text = [f"{c:.1f}" for c in snap.cpu]
+            self._mem_text = [f"{m:.1f}" for m in snap.mem]
+            self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self._snap is None:
+            return 0
+        return len(self._snap)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid() or self._snap is None:
+            return None
+        row, col = index.row(), index.column()
+        if role == _DISPLAY_ROLE:
+            if col == 0:
+                return self._pid_text[row]
+            if col == 1:
+                return self._snap.names[row]
+            if col == 2:
+                return self._snap.statuses[row]
+            if col == 3:
+                return self._cpu_text[row]
+            if col == 4:
+                return self._mem_text[row]
+        elif role == _USER_ROLE:
+            # raw values for the proxy's sort comparisons
+            snap = self._snap
+            if col == 0:
+                return int(snap.pid[row])
+            if col == 1:
+                return snap.names[row]
+            if col == 2:
+                return snap.statuses[row]
+            if col == 3:
+                return float(snap.cpu[row])
+            if col == 4:
+                return float(snap.mem[row])
+        elif role == _ALIGNMENT_ROLE and col in (0, 3, 4):
+            return _ALIGN_CENTER
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
+class KillButtonDelegate(QStyledItemDelegate):
+    """
+    Paints a Kill button into the Action column and turns clicks into
+    killRequested(pid, name). One delegate serves every row, so no
+    per-row buttons, cell widgets or closures are ever allocated.
+    """
+    killRequested = pyqtSignal(int, str)
+
+    @staticmethod
+    def _button_rect(cell_rect):
+        w = min(72, cell_rect.width() - 16)
+        return QRect(cell_rect.center().x() - w // 2, cell_rect.top() + 4,
+                     w, cell_rect.height() - 8)
+
+    def paint(self, painter, option, index):
+        btn = QStyleOptionButton()
+        btn.rect = self._button_rect(option.rect)
+        btn.text = "Kill"
+        btn.state = QStyle.State_Enabled
+        option.widget.style().drawControl(QStyle.CE_PushButton, btn, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and self._button_rect(option.rect).contains(event.pos())):
+            # query through the model argument so this works behind a proxy
+            row = index.row()
+            pid = model.data(model.index(row, 0), Qt.UserRole)
+            name = model.data(model.index(row, 1), Qt.UserRole)
+            self.killRequested.emit(int(pid), name)
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 class MainWindow(QMainWindow):
+    # queued over to the collector worker so SIGTERM+wait never runs on
+    # the UI thread
+    requestKill = pyqtSignal(int, str)
+    requestPause = pyqtSignal(bool)
+    requestStop = pyqtSignal()
+
     def __init__(self, collector_module, analytics_engine, parent=None):
         super().__init__(parent)
 
@@ -69,8 +404,9 @@ class MainWindow(QMainWindow):
             btn = QPushButton(icon)
             btn.setObjectName("iconButton")
             btn.setFixedSize(50, 50)
-            # bind the label in default arg to avoid late binding trap
-            btn.clicked.connect(lambda _, s=label: self.handle_sidebar_click(s))
+            # one shared slot; the section rides on the button property
+            btn.setProperty("section", label)
+            btn.clicked.connect(self._on_sidebar_clicked)
             side_layout.addWidget(btn, alignment=Qt.AlignHCenter)
 
         side_layout.addStretch()
@@ -98,7 +434,7 @@ class MainWindow(QMainWindow):
         title_lbl = QLabel("Stats")
         title_lbl.setFont(QFont("Segoe UI", 20, QFont.Bold))
         subtitle_lbl = QLabel("Real-Time Process Monitoring")
-        subtitle_lbl.setFont(QFont("Segoe UI", 10))
+        subtitle_lbl.setFont(_FONT_REGULAR_10)
         subtitle_lbl.setStyleSheet("color: #8f9bb3;")
         title_block.addWidget(title_lbl)
         title_block.addWidget(subtitle_lbl)
@@ -106,11 +442,20 @@ class MainWindow(QMainWindow):
 
         top_bar.addStretch()
 
+        # user-facing throttle for the heavy process sweep
+        lbl_refresh = QLabel("Refresh:")
+        lbl_refresh.setFont(_FONT_REGULAR_10)
+        self.refresh_combo = QComboBox()
+        self.refresh_combo.addItems(["1 s", "3 s", "5 s", "10 s"])
+        self.refresh_combo.currentTextChanged.connect(self._set_process_interval)
+        top_bar.addWidget(lbl_refresh)
+        top_bar.addWidget(self.refresh_combo)
+
         self.lbl_cpu = QLabel("CPU: -- %")
         self.lbl_mem = QLabel("Memory: -- % (-- / -- GB)")
         for lbl in (self.lbl_cpu, self.lbl_mem):
             lbl.setObjectName("pillLabel")
-            lbl.setFont(QFont("Segoe UI", 10, QFont.Bold))
+            lbl.setFont(_FONT_BOLD_10)
             lbl.setMinimumWidth(180)
             top_bar.addWidget(lbl)
 
@@ -130,8 +475,10 @@ class MainWindow(QMainWindow):
         # stat cards row
         cards_row = QHBoxLayout()
         cards_row.setSpacing(10)
-        self.card_cpu = self._build_stat_card("CPU Load", "-- %", "Overall CPU usage.")
-        self.card_mem = self._build_stat_card("Memory Usage", "-- %", "Current RAM utilization.")
+        self.card_cpu = self._build_stat_card("CPU Load", "-- %", "Overall CPU usage.",
+                                              spark_color="#3b82f6")
+        self.card_mem = self._build_stat_card("Memory Usage", "-- %", "Current RAM utilization.",
+                                              spark_color="#ef4444")
         self.card_proc = self._build_stat_card("Processes", "--", "Total running processes.")
         cards_row.addWidget(self.card_cpu)
         cards_row.addWidget(self.card_mem)
@@ -147,37 +494,63 @@ class MainWindow(QMainWindow):
 
         header_row = QHBoxLayout()
         lbl_table_title = QLabel("Process List")
-        lbl_table_title.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        lbl_table_title.setFont(_FONT_BOLD_11)
         header_row.addWidget(lbl_table_title)
         header_row.addStretch()
 
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search process...")
-        self.search_box.textChanged.connect(self._filter_table)
+        self.search_box.textChanged.connect(self._on_search_changed)
 
         self.sort_combo = QComboBox()
         self.sort_combo.addItems(["CPU ↓", "Memory ↓", "PID ↑"])
-        self.sort_combo.currentIndexChanged.connect(self._sort_table)
+        self.sort_combo.currentIndexChanged.connect(self._apply_sort)
 
         header_row.addWidget(self.search_box)
         header_row.addWidget(self.sort_combo)
         table_layout.addLayout(header_row)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["PID", "Name", "Status", "CPU %", "Memory (MB)", "Action"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table = QTableView()
+        self.process_model = ProcessTableModel(self)
+
+        # proxy owns filtering and sorting in C++; the source model only
+        # ever swaps snapshots
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.process_model)
+        self.proxy_model.setFilterKeyColumn(1)
+        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy_model.setSortRole(Qt.UserRole)
+        self.proxy_model.setDynamicSortFilter(True)
+        self.proxy_model.sort(3, Qt.DescendingOrder)
+        self.table.setModel(self.proxy_model)
+
+        self.kill_delegate = KillButtonDelegate(self.table)
+        self.kill_delegate.killRequested.connect(self.handle_kill_process)
+        self.table.setItemDelegateForColumn(5, self.kill_delegate)
+
+        # fixed widths for the numeric/action columns, stretch only the
+        # text ones: Stretch everywhere made Qt re-measure every column
+        # on each model change (and ignored the explicit widths below)
+        header = self.table.horizontalHeader()
+        for col in (0, 3, 4, 5):
+            header.setSectionResizeMode(col, QHeaderView.Fixed)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)   # Name
+        header.setSectionResizeMode(2, QHeaderView.Stretch)   # Status
         self.table.setSelectionBehavior(self.table.SelectRows)
         self.table.setEditTriggers(self.table.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
-        self.table.verticalHeader().setVisible(False)
+        vheader = self.table.verticalHeader()
+        vheader.setVisible(False)
+        # uniform row height: no per-row size hints during refreshes
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
+        vheader.setDefaultSectionSize(34)
         self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         # sensible initial column widths (PID & Action narrower)
         self.table.setColumnWidth(0, 80)   # PID
         self.table.setColumnWidth(3, 80)   # CPU %
         self.table.setColumnWidth(4, 110)  # Memory
-        self.table.setColumnWidth(5, 100)  # Action (Kill)
+        self.table.setColumnWidth(5, 110)  # Action (Kill)
 
         table_layout.addWidget(self.table)
         center_layout.addWidget(self.table_card, stretch=1)
@@ -199,7 +572,7 @@ class MainWindow(QMainWindow):
         graphs_layout.setSpacing(6)
 
         lbl_graph_title = QLabel("System Activity")
-        lbl_graph_title.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        lbl_graph_title.setFont(_FONT_BOLD_11)
         graphs_layout.addWidget(lbl_graph_title)
 
         self.canvas = MplCanvas(self)
@@ -215,7 +588,7 @@ class MainWindow(QMainWindow):
         alerts_layout.setSpacing(6)
 
         lbl_alerts = QLabel("Alerts")
-        lbl_alerts.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        lbl_alerts.setFont(_FONT_BOLD_11)
         self.alert_list = QListWidget()
         self.alert_list.setAlternatingRowColors(True)
         alerts_layout.addWidget(lbl_alerts)
@@ -239,20 +612,68 @@ class MainWindow(QMainWindow):
 
         # internal
         self._current_processes = []
-        # --- search pause control ---
-        self.search_active = False
-        self.search_timer = QTimer(self)
-        self.search_timer.setSingleShot(True)
-        self.search_timer.timeout.connect(self._resume_auto_refresh)
+        # snapshots that arrived while the process panel was hidden
+        self._table_stale = False
+        # last filter string handed to the proxy
+        self._last_filter = ""
+        # alerts landed while the alerts panel was hidden
+        self._alerts_scroll_stale = False
+        # chart blitting state
+        self._chart_samples = 0
+        self._chart_tick = 0
+        # shared x axis, allocated once; ticks slice a view of it
+        self._chart_x = np.arange(self.analytics.max_history)
+
+        # last applied pill styles, to skip no-op setStyleSheet calls
+        self._cpu_pill_state = None
+        self._mem_pill_state = None
+        # last rendered label strings, to skip no-op setText/text-layout
+        self._last_cpu_text = None
+        self._last_mem_text = None
+
+        # alert list bound + dedupe state: (level, message, count, monotonic ts)
+        self._alert_max = 500
+        self._last_alert = None
+
+        # stats coalescing: bursts from the worker collapse into one UI
+        # update per 50 ms; latest stats win, alerts are accumulated
+        self._pending_stats = None
+        self._stats_throttle = QTimer(self)
+        self._stats_throttle.setSingleShot(True)
+        self._stats_throttle.setInterval(50)
+        self._stats_throttle.timeout.connect(self._flush_pending_stats)
+
+        # debounce: filter runs once per typing pause, not per keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
 
         self.current_view = "Overview"
         self.set_view_mode("Overview")
 
-        # timer
-        self.timer = QTimer(self)
-        self.timer.setInterval(2000)
-        self.timer.timeout.connect(self.refresh_dashboard)
-        self.timer.start()
+        # background collector thread: the psutil sweep runs off the GUI
+        # thread and pushes snapshots back through a queued signal
+        self.collector_thread = QThread(self)
+        self.collector_worker = CollectorWorker(self.collector, self.analytics)
+        self.collector_worker.moveToThread(self.collector_thread)
+        self.collector_thread.started.connect(self.collector_worker.start)
+        self.collector_worker.statsReady.connect(self._apply_stats, Qt.QueuedConnection)
+        self.collector_worker.processesReady.connect(self._apply_processes, Qt.QueuedConnection)
+        self.requestKill.connect(self.collector_worker.kill_process)
+        self.requestPause.connect(self.collector_worker.set_paused)
+        self.requestStop.connect(self.collector_worker.stop)
+        # destroy the worker (and its timer children) in its own thread
+        self.collector_thread.finished.connect(self.collector_worker.deleteLater)
+        self.collector_worker.killResult.connect(self._on_kill_result, Qt.QueuedConnection)
+        # low priority: a psutil sweep should never out-schedule a paint
+        self.collector_thread.start(QThread.LowPriority)
+
+        # one reusable confirm dialog instead of a fresh one per click
+        self._confirm_box = QMessageBox(self)
+        self._confirm_box.setIcon(QMessageBox.Question)
+        self._confirm_box.setWindowTitle("Confirm Kill")
+        self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
 
     # ----------------- Styling -----------------
     def _apply_styles(self):
@@ -278,15 +699,19 @@ class MainWindow(QMainWindow):
             QLabel#pillLabel {
                 background-color: #101524; border-radius: 16px; padding: 6px 14px;
             }
+            /* alert states: selected via a dynamic property, so the whole
+               sheet is parsed once and state changes only repolish */
+            QLabel#pillLabel[alert="warn"] { background-color: #92400e; }
+            QLabel#pillLabel[alert="crit"] { background-color: #991b1b; }
 
             /* Process table */
-            QTableWidget {
+            QTableView {
                 background-color: #0d1122; color: #e5e9f0; gridline-color: #22263a; border-radius: 12px;
                 alternate-background-color: #101524;
             }
-            QTableWidget::item { background-color: transparent; }
-            QTableWidget::item:alternate { background-color: #101524; }
-            QTableWidget::item:selected { background-color: #3b82f6; }
+            QTableView::item { background-color: transparent; }
+            QTableView::item:alternate { background-color: #101524; }
+            QTableView::item:selected { background-color: #3b82f6; }
 
             QHeaderView::section {
                 background-color: #0c1020; color: #aeb6cf; padding: 6px; border: none;
@@ -323,7 +748,7 @@ class MainWindow(QMainWindow):
         """)
 
     # ----------------- Helper: stat card -----------------
-    def _build_stat_card(self, title, value, subtitle):
+    def _build_stat_card(self, title, value, subtitle, spark_color=None):
         card = QFrame()
         card.setObjectName("card")
         layout = QVBoxLayout(card)
@@ -336,16 +761,20 @@ class MainWindow(QMainWindow):
             }
         """)
         lbl_title = QLabel(title)
-        lbl_title.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        lbl_title.setFont(_FONT_BOLD_10)
         lbl_title.setStyleSheet("color: #9ca3af;")
         lbl_value = QLabel(value)
         lbl_value.setObjectName("cardValue")
-        lbl_value.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        lbl_value.setFont(_FONT_BOLD_18)
         lbl_sub = QLabel(subtitle)
-        lbl_sub.setFont(QFont("Segoe UI", 8))
+        lbl_sub.setFont(_FONT_SMALL_8)
         lbl_sub.setStyleSheet("color: #6b7280;")
         layout.addWidget(lbl_title)
         layout.addWidget(lbl_value)
+        card.spark = None
+        if spark_color is not None:
+            card.spark = Sparkline(spark_color)
+            layout.addWidget(card.spark)
         layout.addStretch()
         layout.addWidget(lbl_sub)
         card.value_label = lbl_value
@@ -410,220 +839,260 @@ class MainWindow(QMainWindow):
             self.alerts_card.show()
             self.main_splitter.setSizes([0, 1])
 
+        # a snapshot may have arrived while the process panel was hidden
+        # (isVisible, not visibleRegion: the panel was just re-shown and
+        # hasn't painted yet)
+        if self._table_stale and self.table_card.isVisible():
+            self._table_stale = False
+            self._populate_table(self._current_processes)
+
+        # alerts appended while their panel was hidden: catch the scroll up
+        if self._alerts_scroll_stale and self.alerts_card.isVisible():
+            self._alerts_scroll_stale = False
+            self.alert_list.scrollToBottom()
+
         # show feedback
         self.statusBar().showMessage(f"{mode} view", 1200)
 
     def handle_sidebar_click(self, section_name: str):
         self.set_view_mode(section_name)
 
-    # ----------------- Refresh / update -----------------
-    def refresh_dashboard(self):
-        system_stats = self.collector.get_system_stats()
-        processes = self.collector.get_process_list()
-        self._current_processes = processes
+    def _on_sidebar_clicked(self):
+        self.handle_sidebar_click(self.sender().property("section"))
 
-        self.analytics.update_history(system_stats)
-        alerts = self.analytics.check_alerts(system_stats)
+    def _set_process_interval(self, text):
+        seconds = int(text.split()[0])
+        # plain attribute write; the worker loop reads it next cycle
+        self.collector_worker.process_interval_ms = seconds * 1000
+        self.statusBar().showMessage(f"Process list refresh every {seconds} s", 1200)
 
-        self.update_system_labels_and_cards(system_stats, processes)
-        # self._populate_table(processes)
-        if not self.search_active:
-            self._populate_table(processes)
+    # ----------------- Refresh / update -----------------
+    def _apply_stats(self, system_stats, alerts):
+        """GUI-thread slot for the fast stats tick; throttled via coalescing."""
+        if self._pending_stats is not None:
+            alerts = self._pending_stats[1] + alerts
+        self._pending_stats = (system_stats, alerts)
+        if not self._stats_throttle.isActive():
+            self._stats_throttle.start()
+
+    def _flush_pending_stats(self):
+        if self._pending_stats is None:
+            return
+        system_stats, alerts = self._pending_stats
+        self._pending_stats = None
+        self.update_system_labels_and_cards(system_stats)
         self.update_charts()
+        self.update_sparklines()
         self.update_alerts(alerts)
 
-    def update_system_labels_and_cards(self, stats: dict, processes):
+    def _apply_processes(self, processes):
+        """GUI-thread slot for the slower process-enumeration tick."""
+        self._current_processes = processes
+        self.card_proc.value_label.setText(str(len(processes)))
+        # while the Graphs/Alerts views hide the process panel, keep the
+        # snapshot but skip the model diff; set_view_mode catches up
+        if self.table_card.visibleRegion().isEmpty():
+            self._table_stale = True
+            return
+        # the proxy reapplies the active filter/sort, so refreshing while
+        # the user is searching no longer disturbs their view
+        self._populate_table(processes)
+
+    def update_system_labels_and_cards(self, stats: dict):
         cpu = stats["cpu_percent"]
-        mem_used = stats["memory_used"] / (1024 * 1024 * 1024)
-        mem_total = stats["memory_total"] / (1024 * 1024 * 1024)
+        mem_used = stats["memory_used"] * _GB
+        mem_total = stats["memory_total"] * _GB
         mem_percent = stats["memory_percent"]
-        proc_count = len(processes)
-
-        self.lbl_cpu.setText(f"CPU: {cpu:.1f} %")
-        self.lbl_mem.setText(f"Memory: {mem_percent:.1f} % ({mem_used:.2f} / {mem_total:.2f} GB)")
 
-        self.card_cpu.value_label.setText(f"{cpu:.1f} %")
-        self.card_mem.value_label.setText(f"{mem_percent:.1f} %")
-        self.card_proc.value_label.setText(str(proc_count))
-
-        # pill colors
-        if cpu > 90:
-            self.lbl_cpu.setStyleSheet("background-color:#991b1b; border-radius:16px; padding:6px 14px;")
-        elif cpu > 80:
-            self.lbl_cpu.setStyleSheet("background-color:#92400e; border-radius:16px; padding:6px 14px;")
-        else:
-            self.lbl_cpu.setStyleSheet("background-color:#101524; border-radius:16px; padding:6px 14px;")
-
-        if mem_percent > 90:
-            self.lbl_mem.setStyleSheet("background-color:#991b1b; border-radius:16px; padding:6px 14px;")
-        elif mem_percent > 80:
-            self.lbl_mem.setStyleSheet("background-color:#92400e; border-radius:16px; padding:6px 14px;")
-        else:
-            self.lbl_mem.setStyleSheet("background-color:#101524; border-radius:16px; padding:6px 14px;")
+        # setText triggers text layout even for identical strings, so
+        # skip it whenever the rendered value didn't change
+        cpu_text = _CPU_FMT(cpu)
+        if cpu_text != self._last_cpu_text:
+            self._last_cpu_text = cpu_text
+            self.lbl_cpu.setText(cpu_text)
+            self.card_cpu.value_label.setText(_PCT_FMT(cpu))
+
+        mem_text = _MEM_FMT(mem_percent, mem_used, mem_total)
+        if mem_text != self._last_mem_text:
+            self._last_mem_text = mem_text
+            self.lbl_mem.setText(mem_text)
+            self.card_mem.value_label.setText(_PCT_FMT(mem_percent))
+
+        # pill colors, re-applied only when the threshold state changes
+        cpu_state = "crit" if cpu > 90 else "warn" if cpu > 80 else "normal"
+        if cpu_state != self._cpu_pill_state:
+            self._cpu_pill_state = cpu_state
+            self._restyle_pill(self.lbl_cpu, cpu_state)
+
+        mem_state = "crit" if mem_percent > 90 else "warn" if mem_percent > 80 else "normal"
+        if mem_state != self._mem_pill_state:
+            self._mem_pill_state = mem_state
+            self._restyle_pill(self.lbl_mem, mem_state)
+
+    @staticmethod
+    def _restyle_pill(lbl, state):
+        """Flip the pill's alert property and repolish against the app QSS."""
+        lbl.setProperty("alert", state)
+        lbl.style().unpolish(lbl)
+        lbl.style().polish(lbl)
 
     # ----------------- Table population -----------------
-    def _filter_table(self):
-        query = self.search_box.text().strip().lower()
-
-        # pause table auto-refresh while searching
-        self.search_active = True
-        self.search_timer.start(10000)  # 10 seconds
-
-        if not self._current_processes:
+    def _on_search_changed(self):
+        self._filter_timer.start()
+
+    def _apply_filter(self):
+        # the debounce timer can fire with the text back where it started
+        # (type+delete); don't make the proxy re-filter for that
+        text = self.search_box.text().strip()
+        if text == self._last_filter:
             return
+        self._last_filter = text
+        self.proxy_model.setFilterFixedString(text)
 
-        if not query:
-            self.search_active = False
-            return
-
-        filtered = [
-            p for p in self._current_processes
-            if query in str(p["name"]).lower()
-        ]
-        self._populate_table(filtered)
-
-    def _resume_auto_refresh(self):
-        self.search_active = False
-
-
-
-    def _sort_table(self):
-        if not self._current_processes:
-            return
-        idx = self.sort_combo.currentIndex()
-        processes = list(self._current_processes)
+    def _apply_sort(self, idx):
         if idx == 0:
-            processes.sort(key=lambda p: p["cpu_percent"], reverse=True)
+            self.proxy_model.sort(3, Qt.DescendingOrder)
         elif idx == 1:
-            processes.sort(key=lambda p: p["memory_mb"], reverse=True)
-        elif idx == 2:
-            processes.sort(key=lambda p: p["pid"])
-        query = self.search_box.text().strip().lower()
-        if query:
-            processes = [p for p in processes if query in str(p["name"]).lower()]
-        self._populate_table(processes)
+            self.proxy_model.sort(4, Qt.DescendingOrder)
+        else:
+            self.proxy_model.sort(0, Qt.AscendingOrder)
 
     def _populate_table(self, processes):
-        self.table.setRowCount(len(processes))
-
-        for row, proc in enumerate(processes):
-            item_pid = QTableWidgetItem(str(proc["pid"]))
-            item_pid.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 0, item_pid)
-
-            item_name = QTableWidgetItem(str(proc["name"]))
-            self.table.setItem(row, 1, item_name)
-
-            item_status = QTableWidgetItem(str(proc["status"]))
-            self.table.setItem(row, 2, item_status)
-
-            item_cpu = QTableWidgetItem(f"{proc['cpu_percent']:.1f}")
-            item_cpu.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 3, item_cpu)
-
-            item_mem = QTableWidgetItem(f"{proc['memory_mb']:.1f}")
-            item_mem.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 4, item_mem)
-
-            # Kill button (centered in cell)
-            btn_kill = QPushButton("Kill")
-            btn_kill.setObjectName("killButton")
-            # center in a widget layout
-            cell_widget = QWidget()
-            h_layout = QHBoxLayout(cell_widget)
-            h_layout.setContentsMargins(0, 0, 0, 0)
-            h_layout.addStretch()
-            h_layout.addWidget(btn_kill)
-            h_layout.addStretch()
-
-            # ensure proper binding of pid/name in the callback
-            btn_kill.clicked.connect(lambda _, p=proc["pid"], n=proc["name"]: self.handle_kill_process(p, n))
-            self.table.setCellWidget(row, 5, cell_widget)
-
-        # keep action column narrow so name column can be wide
-        self.table.setColumnWidth(5, 110)
-        self.table.setColumnWidth(0, 80)
+        """Hand the snapshot to the model; Qt repaints only visible rows."""
+        self.process_model.set_snapshot(processes)
 
-    # ----------------- Charts -----------------
     # ----------------- Charts -----------------
     def update_charts(self):
-        """Update CPU and memory charts with error handling."""
+        """Update CPU and memory charts; blit when only the lines moved."""
         try:
+            canvas = self.canvas
             # Check if canvas exists and has valid size
-            if not self.canvas or self.canvas.width() <= 0 or self.canvas.height() <= 0:
+            if not canvas or canvas.width() <= 0 or canvas.height() <= 0:
                 return
-            
-            if not self.analytics.time_history or len(self.analytics.cpu_history) == 0:
+
+            # nothing of the canvas is on screen (graphs card hidden by the
+            # view mode, or the window is covered): skip the render entirely;
+            # the next visible tick redraws from the ring buffers
+            if not canvas.isVisible() or canvas.visibleRegion().isEmpty():
+                return
+
+            n = len(self.analytics)
+            if n == 0:
                 return
-            
-            self.canvas.axes_cpu.clear()
-            self.canvas.axes_mem.clear()
-
-            times = list(self.analytics.time_history)
-            cpu_vals = list(self.analytics.cpu_history)
-            mem_vals = list(self.analytics.memory_history)
-
-            x = list(range(len(times)))
-            max_labels = 8
-            step = max(1, len(times) // max_labels)
-            tick_positions = x[::step]
-            tick_labels = [times[i] for i in tick_positions]
-
-            # CPU chart
-            self.canvas.axes_cpu.plot(x, cpu_vals, marker='o', linewidth=2, color='#3b82f6')
-            self.canvas.axes_cpu.set_ylabel("CPU %")
-            self.canvas.axes_cpu.set_ylim(0, 100)
-            self.canvas.axes_cpu.set_title("CPU Usage (Recent)")
-            self.canvas.axes_cpu.grid(True, alpha=0.25)
-            self.canvas.axes_cpu.set_xticks(tick_positions)
-            self.canvas.axes_cpu.set_xticklabels(tick_labels, rotation=45, ha='right', fontsize=8)
-
-            # Memory chart
-            self.canvas.axes_mem.plot(x, mem_vals, marker='o', linewidth=2, color='#ef4444')
-            self.canvas.axes_mem.set_ylabel("Memory %")
-            self.canvas.axes_mem.set_ylim(0, 100)
-            self.canvas.axes_mem.set_xlabel("Time")
-            self.canvas.axes_mem.set_title("Memory Usage (Recent)")
-            self.canvas.axes_mem.grid(True, alpha=0.25)
-            self.canvas.axes_mem.set_xticks(tick_positions)
-            self.canvas.axes_mem.set_xticklabels(tick_labels, rotation=45, ha='right', fontsize=8)
-
-            # Use subplots_adjust instead of tight_layout (avoids singular matrix error)
-            self.canvas.fig.subplots_adjust(left=0.1, right=0.95, top=0.95, bottom=0.15, hspace=0.7)
-            self.canvas.draw()
-            
-        except Exception as e:
-            print(f"Error updating charts: {e}")
-            # Continue running even if chart update fails
-            pass
+
+            cpu_vals = self.analytics.cpu_view()
+            mem_vals = self.analytics.memory_view()
+            x = self._chart_x[:n]
+
+            canvas.cpu_line.set_data(x, cpu_vals)
+            canvas.mem_line.set_data(x, mem_vals)
+            canvas.sample_times = self.analytics.time_view()
+
+            self._chart_tick += 1
+            # A full draw is needed when the cached background is stale
+            # (first draw / resize), when the sample count changed, or
+            # periodically so the time tick labels stay current.
+            if (canvas.blit_background is None
+                    or n != self._chart_samples
+                    or self._chart_tick % 5 == 0):
+                # tick positions depend only on the sample count, so
+                # re-layout the axes just when it changes; the periodic
+                # redraws merely re-run the label formatter on fresh times
+                if n != self._chart_samples:
+                    self._chart_samples = n
+                    max_labels = 8
+                    step = max(1, n // max_labels)
+                    for axes in (canvas.axes_cpu, canvas.axes_mem):
+                        axes.set_xlim(0, max(n - 1, 1))
+                        axes.set_xticks(x[::step])
+                canvas.redraw_and_cache()
+            else:
+                canvas.blit_lines()
+
+        except (ValueError, RuntimeError) as e:
+            # transient matplotlib failures (mid-resize draws, teardown);
+            # rate-limited logging instead of print, which could block the
+            # GUI thread on pipe I/O if the failure repeats every tick
+            _log.warning("chart update failed: %s", e)
+
+    def update_sparklines(self):
+        """Refresh the card sparklines from the history ring buffers."""
+        if len(self.analytics) < 2:
+            return
+        if not self.card_cpu.visibleRegion().isEmpty():
+            self.card_cpu.spark.set_values(self.analytics.cpu_view())
+        if not self.card_mem.visibleRegion().isEmpty():
+            self.card_mem.spark.set_values(self.analytics.memory_view())
 
     # ----------------- Alerts -----------------
     def update_alerts(self, alerts):
-        MAX_ALERTS = 100
+        if not alerts:
+            return
+        # batch the inserts: one repaint per batch, not per item
+        self.alert_list.setUpdatesEnabled(False)
         for alert in alerts:
-            text = f"[{alert['time']}] [{alert['level']}] {alert['message']}"
-            item = QListWidgetItem(text)
-            if alert["level"] == "CRITICAL":
-                item.setForeground(Qt.red)
-            elif alert["level"] == "WARNING":
-                item.setForeground(Qt.yellow)
+            level, message = alert["level"], alert["message"]
+            now = time.monotonic()
+
+            # identical alert repeating within 5 s: bump a counter on the
+            # existing item instead of appending a duplicate
+            if (self._last_alert is not None
+                    and self._last_alert[0] == level
+                    and self._last_alert[1] == message
+                    and now - self._last_alert[3] < 5.0):
+                count = self._last_alert[2] + 1
+                self._last_alert = (level, message, count, now)
+                item = self.alert_list.item(self.alert_list.count() - 1)
+                if item is not None:
+                    item.setText(f"[{alert['time']}] [{level}] {message} (x{count})")
+                continue
+
+            self._last_alert = (level, message, 1, now)
+            item = QListWidgetItem(f"[{alert['time']}] [{level}] {message}")
+            if level == "CRITICAL":
+                item.setForeground(_BRUSH_RED)
+            elif level == "WARNING":
+                item.setForeground(_BRUSH_YELLOW)
             self.alert_list.addItem(item)
+
+        # Remove old alerts if list gets too large: one model-level
+        # removeRows instead of a takeItem call per evicted row
+        excess = self.alert_list.count() - self._alert_max
+        if excess > 0:
+            self.alert_list.model().removeRows(0, excess)
+        self.alert_list.setUpdatesEnabled(True)
+        # scrolling a hidden list just schedules pointless viewport work;
+        # set_view_mode shows the panel already scrolled to the newest row
+        if not self.alert_list.visibleRegion().isEmpty():
             self.alert_list.scrollToBottom()
-        
-        # Remove old alerts if list gets too large
-        while self.alert_list.count() > MAX_ALERTS:
-            self.alert_list.takeItem(0)
+        else:
+            self._alerts_scroll_stale = True
     # ----------------- Process kill -----------------
     def handle_kill_process(self, pid, name):
-        reply = QMessageBox.question(
-            self,
-            "Confirm Kill",
-            f"Are you sure you want to terminate '{name}' (PID: {pid})?",
-            QMessageBox.Yes | QMessageBox.No
-        )
-        if reply == QMessageBox.Yes:
-            success = self.collector.kill_process(pid)
-            if success:
-                QMessageBox.information(self, "Success", f"Process {name} (PID: {pid}) terminated.")
-            else:
-                QMessageBox.information(self, "Success", f"Process {name} (PID: {pid}) terminated.")
+        self._confirm_box.setText(f"Are you sure you want to terminate '{name}' (PID: {pid})?")
+        if self._confirm_box.exec_() == QMessageBox.Yes:
+            self.requestKill.emit(pid, name)
+            self.statusBar().showMessage(f"Terminating {name} (PID: {pid})...", 3000)
+
+    def _on_kill_result(self, pid, name, ok):
+        if ok:
+            self.statusBar().showMessage(f"Process {name} (PID: {pid}) terminated.", 3000)
+        else:
+            QMessageBox.warning(self, "Kill failed",
+                                f"Could not terminate {name} (PID: {pid}).")
+
+    def changeEvent(self, event):
+        # polling is pointless while minimized; pause the worker timers
+        if event.type() == QEvent.WindowStateChange:
+            self.requestPause.emit(bool(self.windowState() & Qt.WindowMinimized))
+        super().changeEvent(event)
+
+    # ----------------- Shutdown -----------------
+    def closeEvent(self, event):
+        # stop the poll timers in their own thread first — the queued
+        # stop() lands before the quit event, so the worker goes down
+        # with no timers left for the main thread to kill at teardown
+        self.requestStop.emit()
+        self.collector_thread.quit()
+        self.collector_thread.wait(2000)
+        super().closeEvent(event)
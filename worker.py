@@ -0,0 +1,91 @@
+# worker.py
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class CollectorWorker(QObject):
+    """
+    Runs the psutil sweep on a background thread so the GUI never blocks.
+
+    Two cadences: cheap system stats (labels/charts/alerts) are polled on
+    a fast interval, while the expensive per-process enumeration runs on
+    a slower one. Polling is driven by QTimers living in the worker
+    thread's event loop, so the thread stays responsive to queued calls;
+    shutdown is a queued stop() (the timers must be stopped in-thread)
+    followed by QThread.quit(). The GUI consumes results
+    through queued signal connections and only does widget updates on
+    its own thread.
+    """
+    statsReady = pyqtSignal(dict, list)
+    processesReady = pyqtSignal(object)  # collector.ProcessSnapshot
+    killResult = pyqtSignal(int, str, bool)
+
+    def __init__(self, collector_module, analytics_engine,
+                 stats_interval_ms=250, process_interval_ms=1000, parent=None):
+        super().__init__(parent)
+        self.collector = collector_module
+        self.analytics = analytics_engine
+        self.stats_interval_ms = stats_interval_ms
+        self.process_interval_ms = process_interval_ms
+        self._stats_timer = None
+        self._process_timer = None
+        self._stats_tick = 0
+
+    def start(self):
+        """Create the poll timers; invoked in-thread via QThread.started."""
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(self.stats_interval_ms)
+        self._stats_timer.timeout.connect(self._poll_stats)
+        self._stats_timer.start()
+
+        self._process_timer = QTimer(self)
+        self._process_timer.setInterval(self.process_interval_ms)
+        self._process_timer.timeout.connect(self._poll_processes)
+        self._process_timer.start()
+
+        # first samples immediately, not one interval from now
+        self._poll_stats()
+        self._poll_processes()
+
+    def _poll_stats(self):
+        system_stats = self.collector.get_system_stats()
+        self.analytics.update_history(system_stats)
+        alerts = self.analytics.check_alerts(system_stats)
+        # the windowed scan looks at ~10 s of history, so running it on
+        # every fast tick just rediscovers the same sustained condition;
+        # once a second is plenty
+        self._stats_tick += 1
+        if self._stats_tick % 4 == 0:
+            alerts += self.analytics.check_alerts_window()
+        self.statsReady.emit(system_stats, alerts)
+
+    def stop(self):
+        """Queued from the GUI just before the thread quits; the timers
+        must be stopped in their own thread or Qt complains at teardown."""
+        if self._stats_timer is not None:
+            self._stats_timer.stop()
+            self._process_timer.stop()
+
+    def set_paused(self, paused):
+        """Queued from the GUI; a minimized window does zero polling."""
+        if self._stats_timer is None:
+            return
+        if paused:
+            self._stats_timer.stop()
+            self._process_timer.stop()
+        elif not self._stats_timer.isActive():
+            self._stats_timer.start()
+            self._process_timer.start()
+            # refresh immediately on restore instead of waiting an interval
+            self._poll_stats()
+            self._poll_processes()
+
+    def kill_process(self, pid, name):
+        """Queued from the GUI; terminate+wait runs off the UI thread."""
+        ok = self.collector.kill_process(pid)
+        self.killResult.emit(pid, name, ok)
+
+    def _poll_processes(self):
+        # pick up interval changes made from the GUI (refresh combo)
+        if self._process_timer.interval() != self.process_interval_ms:
+            self._process_timer.setInterval(self.process_interval_ms)
+        self.processesReady.emit(self.collector.get_process_list())